@@ -1,7 +1,9 @@
 """Activities for namespace operations."""
 
+import asyncio
 import logging
-import math
+from functools import lru_cache
+from typing import Optional
 
 from temporalio import activity
 
@@ -12,6 +14,11 @@ from ..models.types import NamespaceInfo, NamespaceMetrics, NamespaceRecommendat
 
 logger = logging.getLogger(__name__)
 
+# TRU capacity model constants, hoisted so the recommendation math and its
+# callers share one definition instead of rebuilding locals per call
+_MAX_APS_PER_TRU = 500
+_MIN_APS_PER_ADDITIONAL_TRU = 100
+
 
 @activity.defn
 async def get_all_namespace_metrics() -> list[NamespaceRecommendation]:
@@ -31,51 +38,86 @@ async def get_all_namespace_metrics() -> list[NamespaceRecommendation]:
     
     activity.logger.info("Activity: get_all_namespace_metrics started")
     
-    metrics_client = OpenMetricsClient(
+    # The async contexts guarantee both HTTP clients are closed on any exit
+    # path without an explicit try/finally
+    async with OpenMetricsClient(
         api_key=settings.temporal_cloud_metrics_api_key,
         base_url=settings.cloud_metrics_api_base_url,
-    )
-    
-    cloud_ops_client = CloudOpsClient(
+    ) as metrics_client, CloudOpsClient(
         api_key=settings.temporal_cloud_ops_api_key,
         base_url=settings.cloud_ops_api_base_url,
-    )
-    
-    try:
-        # Make single API call to get all namespace metrics
-        metrics_by_namespace = await metrics_client.get_all_namespace_metrics()
-        
-        activity.logger.info(
-            f"Retrieved metrics for {len(metrics_by_namespace)} namespaces"
-        )
-        
-        # Convert to NamespaceRecommendation objects
-        recommendations = []
-        processed_count = 0
+    ) as cloud_ops_client:
 
-        for namespace, metrics in metrics_by_namespace.items():
-            # Filter based on allow/deny lists
-            if not settings.should_manage_namespace(namespace):
-                activity.logger.debug(f"Skipping filtered namespace: {namespace}")
-                continue
-            
-            action_limit = metrics.get('action_limit', 0.0)
-            action_count = metrics.get('action_count', 0.0)
-            
-            # Calculate recommended TRUs
-            recommended_trus = _calculate_recommended_trus(action_limit, action_count)
-            
-            # Determine recommended capacity mode based on recommended TRUs
-            if recommended_trus == 0:
-                recommended_capacity_mode = "on-demand"
-            else:
-                recommended_capacity_mode = "provisioned"
-            
-            # Get current capacity mode from Cloud Ops API
+        async def _list_namespace_infos() -> Optional[dict[str, NamespaceInfo]]:
+            """Fetch capacity state for every namespace with one Cloud Ops call."""
             try:
-                namespace_info = await cloud_ops_client.get_namespace_info(namespace)
-                if namespace_info:
-                    if namespace_info.provisioning_state == ProvisioningState.ENABLED:
+                return {
+                    info.namespace: info
+                    for info in await cloud_ops_client.list_namespaces()
+                }
+            except Exception as e:
+                # Log error but continue with defaults for every namespace
+                activity.logger.error(f"Failed to list namespaces from Cloud Ops API: {e}")
+                return None
+
+        try:
+            # The metrics scrape and the Cloud Ops namespace listing are
+            # independent API calls; run them concurrently. When an allowlist is
+            # configured, push it down to the metrics query so unmanaged
+            # namespaces are never fetched or parsed.
+            metrics_by_namespace, namespace_infos = await asyncio.gather(
+                metrics_client.get_all_namespace_metrics(
+                    namespaces=settings.namespace_allowlist or None
+                ),
+                _list_namespace_infos(),
+            )
+
+            activity.logger.info(
+                f"Retrieved metrics for {len(metrics_by_namespace)} namespaces"
+            )
+
+            # Filter based on allow/deny lists
+            managed_namespaces = []
+            for namespace in metrics_by_namespace:
+                if settings.should_manage_namespace(namespace):
+                    managed_namespaces.append(namespace)
+                else:
+                    activity.logger.debug("Skipping filtered namespace: %s", namespace)
+
+            # Sort once so the recommendation list (and therefore the workflow
+            # result payload) is deterministic regardless of response ordering
+            managed_namespaces.sort()
+
+            # Convert to NamespaceRecommendation objects
+            recommendations = []
+            processed_count = 0
+            # Cache the enum member used in the per-namespace comparison
+            enabled_state = ProvisioningState.ENABLED
+            # str(recommendation) is costly; only build it when debug is on
+            debug_enabled = activity.logger.isEnabledFor(logging.DEBUG)
+
+            for namespace in managed_namespaces:
+                metrics = metrics_by_namespace[namespace]
+                action_limit = metrics.get('action_limit', 0.0)
+                action_count = metrics.get('action_count', 0.0)
+
+                # Calculate recommended TRUs
+                recommended_trus = _calculate_recommended_trus(action_limit, action_count)
+
+                # Determine recommended capacity mode based on recommended TRUs
+                if recommended_trus == 0:
+                    recommended_capacity_mode = "on-demand"
+                else:
+                    recommended_capacity_mode = "provisioned"
+
+                # Use the current capacity mode fetched from the Cloud Ops API
+                namespace_info = namespace_infos.get(namespace) if namespace_infos is not None else None
+                if namespace_infos is None:
+                    # Listing failed entirely - fall back to defaults
+                    current_capacity_mode = "on-demand"
+                    current_trus = None
+                elif namespace_info:
+                    if namespace_info.provisioning_state == enabled_state:
                         current_capacity_mode = "provisioned"
                         current_trus = namespace_info.current_tru_count
                     else:
@@ -86,45 +128,38 @@ async def get_all_namespace_metrics() -> list[NamespaceRecommendation]:
                     current_capacity_mode = "on-demand"
                     current_trus = None
                     activity.logger.warning(f"Namespace {namespace} not found in Cloud Ops API")
-            except Exception as e:
-                # Log error but continue with defaults
-                activity.logger.error(f"Failed to get capacity mode for {namespace}: {e}")
-                current_capacity_mode = "on-demand"
-                current_trus = None
-            
-            recommendation = NamespaceRecommendation(
-                namespace=namespace,
-                action_limit=action_limit,
-                action_count=action_count,
-                recommended_trus=recommended_trus,
-                current_capacity_mode=current_capacity_mode,
-                current_trus=current_trus,
-                recommended_capacity_mode=recommended_capacity_mode,
-            )
-            recommendations.append(recommendation)
+
+                recommendation = NamespaceRecommendation(
+                    namespace=namespace,
+                    action_limit=action_limit,
+                    action_count=action_count,
+                    recommended_trus=recommended_trus,
+                    current_capacity_mode=current_capacity_mode,
+                    current_trus=current_trus,
+                    recommended_capacity_mode=recommended_capacity_mode,
+                )
+                recommendations.append(recommendation)
             
-            processed_count += 1
+                processed_count += 1
             
-            # Send heartbeat every 5 namespaces
-            if processed_count % 5 == 0:
-                activity.heartbeat(f"Processed {processed_count}/{len(metrics_by_namespace)} namespaces")
-                activity.logger.info(f"Heartbeat: Processed {processed_count}/{len(metrics_by_namespace)} namespaces")
+                # Send heartbeat every 5 namespaces
+                if processed_count % 5 == 0:
+                    activity.heartbeat(f"Processed {processed_count}/{len(metrics_by_namespace)} namespaces")
+                    activity.logger.info("Heartbeat: Processed %d/%d namespaces", processed_count, len(metrics_by_namespace))
             
-            activity.logger.debug(str(recommendation))
+                if debug_enabled:
+                    activity.logger.debug(str(recommendation))
         
-        activity.logger.info(
-            f"Generated {len(recommendations)} recommendations "
-            f"after filtering"
-        )
+            activity.logger.info(
+                f"Generated {len(recommendations)} recommendations "
+                f"after filtering"
+            )
         
-        return recommendations
+            return recommendations
         
-    except Exception as e:
-        activity.logger.error(f"Failed to get all namespace metrics: {e}")
-        raise
-    finally:
-        await metrics_client.close()
-        await cloud_ops_client.close()
+        except Exception as e:
+            activity.logger.error(f"Failed to get all namespace metrics: {e}")
+            raise
 
 
 def calculate_minimum_charged_aps(trus: int) -> int:
@@ -137,11 +172,8 @@ def calculate_minimum_charged_aps(trus: int) -> int:
     Returns:
         Minimum APS that will be charged
     """
-    if trus == 0:
-        return 0
-    if trus == 1:
-        return 0  # First TRU has no minimum
-    return (trus - 1) * 100  # Each additional TRU has 100 APS minimum
+    # First TRU has no minimum; each additional TRU adds 100 APS
+    return max(0, (trus - 1) * _MIN_APS_PER_ADDITIONAL_TRU)
 
 @activity.defn
 async def verify_namespace_capacity(
@@ -173,70 +205,72 @@ async def verify_namespace_capacity(
         f"(expected mode: {expected_capacity_mode}, expected TRUs: {expected_trus})"
     )
     
-    client = CloudOpsClient(
+    async with CloudOpsClient(
         api_key=settings.temporal_cloud_ops_api_key,
         base_url=settings.cloud_ops_api_base_url,
-    )
-    
-    try:
-        namespace_info = await client.get_namespace_info(namespace)
-        
-        if not namespace_info:
-            activity.logger.error(f"Namespace {namespace} not found")
-            return False
+    ) as client:
+        try:
+            namespace_info = await client.get_namespace_info(namespace)
         
-        # Check based on expected capacity mode
-        if expected_capacity_mode == "provisioned":
-            # Verify provisioning is enabled
-            if namespace_info.provisioning_state != ProvisioningState.ENABLED:
-                activity.logger.error(
-                    f"Namespace {namespace} provisioning state is "
-                    f"{namespace_info.provisioning_state}, expected ENABLED for provisioned mode"
-                )
+            if not namespace_info:
+                activity.logger.error(f"Namespace {namespace} not found")
                 return False
+        
+            # Check based on expected capacity mode
+            if expected_capacity_mode == "provisioned":
+                # Verify provisioning is enabled
+                if namespace_info.provisioning_state != ProvisioningState.ENABLED:
+                    activity.logger.error(
+                        f"Namespace {namespace} provisioning state is "
+                        f"{namespace_info.provisioning_state}, expected ENABLED for provisioned mode"
+                    )
+                    return False
             
-            # Verify TRU count matches
-            if namespace_info.current_tru_count != expected_trus:
-                activity.logger.error(
-                    f"Namespace {namespace} has {namespace_info.current_tru_count} TRUs, "
-                    f"expected {expected_trus}"
+                # Verify TRU count matches
+                if namespace_info.current_tru_count != expected_trus:
+                    activity.logger.error(
+                        f"Namespace {namespace} has {namespace_info.current_tru_count} TRUs, "
+                        f"expected {expected_trus}"
+                    )
+                    return False
+            
+                activity.logger.info(
+                    f"Namespace {namespace} capacity verified: "
+                    f"provisioned mode with {expected_trus} TRUs"
                 )
-                return False
+                return True
             
-            activity.logger.info(
-                f"Namespace {namespace} capacity verified: "
-                f"provisioned mode with {expected_trus} TRUs"
-            )
-            return True
+            elif expected_capacity_mode == "on-demand":
+                # Verify provisioning is disabled
+                if namespace_info.provisioning_state != ProvisioningState.DISABLED:
+                    activity.logger.error(
+                        f"Namespace {namespace} provisioning state is "
+                        f"{namespace_info.provisioning_state}, expected DISABLED for on-demand mode"
+                    )
+                    return False
+            
+                activity.logger.info(
+                    f"Namespace {namespace} capacity verified: on-demand mode"
+                )
+                return True
             
-        elif expected_capacity_mode == "on-demand":
-            # Verify provisioning is disabled
-            if namespace_info.provisioning_state != ProvisioningState.DISABLED:
+            else:
                 activity.logger.error(
-                    f"Namespace {namespace} provisioning state is "
-                    f"{namespace_info.provisioning_state}, expected DISABLED for on-demand mode"
+                    f"Invalid expected_capacity_mode: {expected_capacity_mode}. "
+                    f"Must be 'provisioned' or 'on-demand'"
                 )
                 return False
-            
-            activity.logger.info(
-                f"Namespace {namespace} capacity verified: on-demand mode"
-            )
-            return True
-            
-        else:
-            activity.logger.error(
-                f"Invalid expected_capacity_mode: {expected_capacity_mode}. "
-                f"Must be 'provisioned' or 'on-demand'"
-            )
-            return False
         
-    except Exception as e:
-        activity.logger.error(f"Failed to verify capacity for {namespace}: {e}")
-        raise
-    finally:
-        await client.close()
+        except Exception as e:
+            activity.logger.error(f"Failed to verify capacity for {namespace}: {e}")
+            raise
 
 
+# The function is pure, limits are multiples of 500, and counts cluster
+# around steady-state values, so repeated analysis runs hit the cache; keys
+# are the exact inputs, never quantized, so cached results are identical to
+# computed ones
+@lru_cache(maxsize=4096)
 def _calculate_recommended_trus(action_limit: float, action_count: float) -> int:
     """Calculate recommended number of TRUs based on metrics.
 
@@ -250,11 +284,13 @@ def _calculate_recommended_trus(action_limit: float, action_count: float) -> int
     Returns:
         Recommended number of TRUs (0 or 2+, never 1)
     """
-    max_aps_per_tru = 500
-    min_aps_per_additional_tru = 100
-    
+    max_aps_per_tru = _MAX_APS_PER_TRU
+    min_aps_per_additional_tru = _MIN_APS_PER_ADDITIONAL_TRU
+
     # Calculate current TRUs from action_limit
-    current_trus = math.floor(action_limit / max_aps_per_tru)
+    # Floor/ceil via integer division avoids math-module calls in what is
+    # the hottest pure-Python function of the bulk analysis
+    current_trus = int(action_limit // max_aps_per_tru)
     
     # Treat 1 TRU as equivalent to 0 TRUs (same capacity)
     if current_trus <= 1:
@@ -265,18 +301,19 @@ def _calculate_recommended_trus(action_limit: float, action_count: float) -> int
         # Only enable if we need more than base capacity (500 APS)
         if action_count > max_aps_per_tru:
             # Need provisioned capacity - round up to nearest TRU (minimum 2)
-            return max(2, math.ceil(action_count / max_aps_per_tru))
+            return max(2, -int(-action_count // max_aps_per_tru))
         else:
             # Base capacity is sufficient
             return 0
     
     # Current capacity metrics
     max_capacity = current_trus * max_aps_per_tru
-    utilization_percent = (action_count / max_capacity) * 100
     min_charged = calculate_minimum_charged_aps(current_trus)
-    
-    # Scale up: if using >= 80% of capacity, add 1 TRU
-    if utilization_percent >= 80:
+
+    # Scale up: if using >= 80% of capacity, add 1 TRU. The cross-multiplied
+    # form (count/capacity >= 0.8 <=> 5*count >= 4*capacity) avoids the
+    # division and is exact for these magnitudes.
+    if action_count * 5 >= max_capacity * 4:
         return current_trus + 1
     
     # Scale down: if current usage is below minimum charged threshold
@@ -288,7 +325,7 @@ def _calculate_recommended_trus(action_limit: float, action_count: float) -> int
         # Calculate optimal TRUs for usage above base capacity
         # We want: action_count >= (optimal_trus - 1) * 100
         # So: optimal_trus <= (action_count / 100) + 1
-        optimal_trus = math.floor(action_count / min_aps_per_additional_tru) + 1
+        optimal_trus = int(action_count // min_aps_per_additional_tru) + 1
         
         # Directly recommend the optimal TRU count (not gradual)
         # Never recommend 1 TRU (same as 0 TRUs)
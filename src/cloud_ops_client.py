@@ -13,6 +13,8 @@ logger = logging.getLogger(__name__)
 class CloudOpsClient:
     """Client for interacting with Temporal Cloud Ops API."""
 
+    __slots__ = ("api_key", "base_url", "client")
+
     def __init__(self, api_key: str, base_url: str = "https://saas-api.tmprl.cloud"):
         """Initialize the Cloud Ops API client.
 
@@ -30,6 +32,14 @@ class CloudOpsClient:
             timeout=30.0,
         )
 
+    async def __aenter__(self) -> "CloudOpsClient":
+        """Enter an async context; the client closes itself on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the HTTP client on context exit."""
+        await self.close()
+
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
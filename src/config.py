@@ -1,5 +1,6 @@
 """Configuration management for Temporal Cloud capacity automation."""
 
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -75,14 +76,24 @@ class Settings(BaseSettings):
             return [ns.strip() for ns in v.split(",") if ns.strip()]
         return v or []
 
+    @cached_property
+    def _allowlist_set(self) -> frozenset[str]:
+        """Allowlist as a frozenset for O(1) membership checks."""
+        return frozenset(self.namespace_allowlist)
+
+    @cached_property
+    def _denylist_set(self) -> frozenset[str]:
+        """Denylist as a frozenset for O(1) membership checks."""
+        return frozenset(self.namespace_denylist)
+
     def should_manage_namespace(self, namespace: str) -> bool:
         """Check if a namespace should be managed based on allow/deny lists."""
         # If allowlist is specified, namespace must be in it
-        if self.namespace_allowlist and namespace not in self.namespace_allowlist:
+        if self._allowlist_set and namespace not in self._allowlist_set:
             return False
 
         # If denylist is specified, namespace must not be in it
-        if self.namespace_denylist and namespace in self.namespace_denylist:
+        if namespace in self._denylist_set:
             return False
 
         return True
@@ -23,7 +23,7 @@ class NotificationSeverity(str, Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class NamespaceInfo:
     """Information about a namespace and its provisioning state."""
 
@@ -39,7 +39,7 @@ class NamespaceInfo:
         return f"{self.namespace} ({self.provisioning_state.value})"
 
 
-@dataclass
+@dataclass(slots=True)
 class NamespaceMetrics:
     """Metrics for a namespace to determine if action is needed."""
 
@@ -54,7 +54,7 @@ class NamespaceMetrics:
         return f"{self.namespace}: {self.actions_per_hour} actions/hour{throttle_str}"
 
 
-@dataclass
+@dataclass(slots=True)
 class NamespaceRecommendation:
     """Recommendation for a namespace with action metrics and TRU recommendation."""
 
@@ -79,13 +79,20 @@ class NamespaceRecommendation:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledCapacityChangeInput:
     """Input parameters for scheduled capacity change workflow."""
 
     namespace: str
     desired_trus: int
     end_time: Optional[datetime] = None  # When to revert to on-demand (if provided)
+    # If set, run all activities on this task queue (e.g. to pin them to
+    # workers with affinity for the namespace); defaults to the workflow's queue
+    activity_task_queue: Optional[str] = None
+    # How long to wait before verifying a capacity change, in seconds.
+    # Defaults to the workflow's standard 2 minutes; tests shrink it so the
+    # time-skipping server has fewer simulated timers to dispatch.
+    verification_delay_seconds: Optional[float] = None
 
     def __post_init__(self):
         """Ensure end_time is timezone-aware."""
@@ -99,7 +106,7 @@ class ScheduledCapacityChangeInput:
         return f"Set {self.namespace} to {self.desired_trus} TRUs{end_str}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduledCapacityChangeResult:
     """Result of scheduled capacity change workflow execution."""
 
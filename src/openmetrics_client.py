@@ -1,19 +1,48 @@
 """Client for Temporal Cloud OpenMetrics API."""
 
 import logging
-import re
+import sys
+from collections import defaultdict
 from typing import Optional
 
+try:
+    # Optional: RE2 runs as a DFA with guaranteed linear-time matching and no
+    # backtracking, which keeps parse time bounded on multi-MB metric responses.
+    import re2 as re
+except ImportError:
+    import re
+
 import httpx
 
 from .models.types import NamespaceMetrics
 
 logger = logging.getLogger(__name__)
 
+# OpenMetrics format: metric_name{label="value",...} value timestamp
+# Example: temporal_cloud_v1_workflow_success_count{temporal_namespace="prod"} 42.0 1609459200000
+# Compiled once at import; previously each parse call (and, for labels,
+# each line) recompiled these
+_SAMPLE_PATTERN = re.compile(
+    r'^([a-zA-Z_][a-zA-Z0-9_]*)\{([^}]*)\}\s+([\d.]+)(?:\s+\d+)?$'
+)
+# Matches one line at a time so iteration never materializes a full list of
+# per-line strings the way text.split('\n') does
+_LINE_PATTERN = re.compile(r'[^\n]+')
+
 
 class OpenMetricsClient:
     """Client for interacting with Temporal Cloud OpenMetrics API."""
 
+    __slots__ = (
+        "api_key",
+        "base_url",
+        "client",
+        "_bulk_parse_etag",
+        "_bulk_parse_cache",
+        "_grouped_parse_text",
+        "_grouped_parse_cache",
+    )
+
     def __init__(self, api_key: str, base_url: str = "https://metrics.temporal.io"):
         """Initialize the OpenMetrics API client.
 
@@ -29,17 +58,39 @@ class OpenMetricsClient:
             },
             timeout=30.0,
         )
+        # Cache of the last parsed bulk response, keyed by its ETag header,
+        # so identical repeated responses skip the parse entirely
+        self._bulk_parse_etag: Optional[str] = None
+        self._bulk_parse_cache: Optional[dict[str, dict[str, float]]] = None
+        # Cache of the last grouped per-namespace parse, keyed by the text
+        # it was parsed from
+        self._grouped_parse_text: Optional[str] = None
+        self._grouped_parse_cache: Optional[dict[str, dict[str, float]]] = None
+
+    async def __aenter__(self) -> "OpenMetricsClient":
+        """Enter an async context; the client closes itself on exit."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the HTTP client on context exit."""
+        await self.close()
 
     async def close(self):
         """Close the HTTP client."""
         await self.client.aclose()
 
-    async def get_all_namespace_metrics(self) -> dict[str, dict[str, float]]:
+    async def get_all_namespace_metrics(
+        self, namespaces: Optional[list[str]] = None
+    ) -> dict[str, dict[str, float]]:
         """Get action limit and action count metrics for all namespaces.
 
         This method queries the OpenMetrics API using the metrics query parameter
         to filter for only the specific metrics we need, reducing response size.
 
+        Args:
+            namespaces: If provided, restrict the query to these namespaces so
+                the API only returns (and we only parse) relevant series
+
         Returns:
             Dictionary mapping namespace to metrics dict containing:
             - 'action_limit': temporal_cloud_v1_action_limit
@@ -53,14 +104,17 @@ class OpenMetricsClient:
         try:
             # Query metrics with filtering to get only specific metrics
             # Using query parameters to reduce response size at the API level
+            params: dict = {
+                "metrics": [
+                    "temporal_cloud_v1_action_limit",
+                    "temporal_cloud_v1_total_action_count",
+                ]
+            }
+            if namespaces:
+                params["namespaces"] = namespaces
             response = await self.client.get(
                 f"{self.base_url}/v1/metrics",
-                params={
-                    "metrics": [
-                        "temporal_cloud_v1_action_limit",
-                        "temporal_cloud_v1_total_action_count",
-                    ]
-                },
+                params=params,
             )
             response.raise_for_status()
 
@@ -71,9 +125,23 @@ class OpenMetricsClient:
                     f"Metrics response is {completeness}, data may be incomplete"
                 )
 
+            # Reuse the last parse when the server reports an unchanged body.
+            # Copy the cached dicts on the way out so callers can never
+            # mutate the memoized parse under a later hit.
+            etag = response.headers.get("ETag")
+            if etag and etag == self._bulk_parse_etag and self._bulk_parse_cache is not None:
+                logger.debug("Metrics response unchanged (ETag %s), reusing parsed result", etag)
+                return {ns: dict(v) for ns, v in self._bulk_parse_cache.items()}
+
             # Parse OpenMetrics format for all namespaces
             metrics_by_namespace = self._parse_all_namespace_metrics(response.text)
 
+            if etag:
+                self._bulk_parse_etag = etag
+                self._bulk_parse_cache = {
+                    ns: dict(v) for ns, v in metrics_by_namespace.items()
+                }
+
             logger.info(f"Retrieved metrics for {len(metrics_by_namespace)} namespaces")
             return metrics_by_namespace
 
@@ -164,27 +232,34 @@ class OpenMetricsClient:
             - 'action_limit': temporal_cloud_v1_action_limit
             - 'action_count': temporal_cloud_v1_total_action_count
         """
-        namespace_metrics = {}
-        
-        # OpenMetrics format: metric_name{label="value",...} value timestamp
-        pattern = re.compile(
-            r'^([a-zA-Z_][a-zA-Z0-9_]*)\{([^}]*)\}\s+([\d.]+)(?:\s+\d+)?$'
-        )
-        
+        # Accumulate each metric into its own flat dict (structure-of-arrays
+        # style) instead of building a nested dict per line; the nested result
+        # shape is assembled once at the end.
+        action_limits: dict[str, float] = {}
+        action_counts: dict[str, float] = {}
+
         # Metrics we're interested in
         target_metrics = {
             'temporal_cloud_v1_action_limit',
             'temporal_cloud_v1_total_action_count'
         }
-        
-        for line in text.split('\n'):
-            line = line.strip()
+
+        # Local binding avoids a global lookup per parsed line
+        _float = float
+
+        for line_match in _LINE_PATTERN.finditer(text):
+            line = line_match.group().strip()
             
             # Skip comments and TYPE/HELP lines
             if line.startswith('#') or not line:
                 continue
+
+            # Cheap substring rejection before any regex work: every sample
+            # we keep must carry a temporal_namespace label
+            if 'temporal_namespace=' not in line:
+                continue
             
-            match = pattern.match(line)
+            match = _SAMPLE_PATTERN.match(line)
             if match:
                 metric_name = match.group(1)
                 
@@ -193,82 +268,138 @@ class OpenMetricsClient:
                     continue
                 
                 labels_str = match.group(2)
-                value = float(match.group(3))
-                
-                # Parse labels
-                labels = {}
-                label_pattern = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="([^"]*)"')
-                for label_match in label_pattern.finditer(labels_str):
-                    labels[label_match.group(1)] = label_match.group(2)
-                
-                # Get the namespace from labels
-                namespace = labels.get('temporal_namespace')
+
+                # Slice straight to the temporal_namespace value with
+                # partition instead of tokenizing every label; the leading
+                # ',' anchors the match at a label boundary so longer label
+                # names such as other_temporal_namespace never match
+                _, sep, rest = (',' + labels_str).partition(',temporal_namespace="')
+                if not sep:
+                    continue
+                namespace = rest.partition('"')[0]
                 if not namespace:
                     continue
-                
-                # Initialize namespace dict if needed
-                if namespace not in namespace_metrics:
-                    namespace_metrics[namespace] = {
-                        'action_limit': 0.0,
-                        'action_count': 0.0
-                    }
-                
-                # Store the metric value
+
+                # Convert the value only for lines we actually keep
+                value = _float(match.group(3))
+
+                # Store the metric value in the matching flat dict
                 if metric_name == 'temporal_cloud_v1_action_limit':
-                    namespace_metrics[namespace]['action_limit'] = value
+                    action_limits[namespace] = value
                 elif metric_name == 'temporal_cloud_v1_total_action_count':
-                    namespace_metrics[namespace]['action_count'] = value
-        
-        return namespace_metrics
+                    action_counts[namespace] = value
+
+        # Assemble the per-namespace result shape in a single pass
+        return {
+            namespace: {
+                'action_limit': action_limits.get(namespace, 0.0),
+                'action_count': action_counts.get(namespace, 0.0),
+            }
+            for namespace in action_limits.keys() | action_counts.keys()
+        }
 
-    def _parse_openmetrics(self, text: str, namespace: str) -> dict[str, float]:
-        """Parse OpenMetrics format text into a dictionary of metric values.
+    def _parse_openmetrics_grouped(self, text: str) -> dict[str, dict[str, float]]:
+        """Parse OpenMetrics format text into per-namespace metric aggregates.
+
+        A single pass groups every sample by its temporal_namespace label, so
+        repeated per-namespace lookups against one payload never rescan the
+        text. Metric and namespace names are interned since the same few
+        strings repeat across thousands of lines.
 
         Args:
             text: OpenMetrics format text response
-            namespace: The namespace to filter for
 
         Returns:
-            Dictionary mapping metric names to their values
+            Dictionary mapping namespace to a dict of metric name to value
         """
-        metrics = {}
-        
-        # OpenMetrics format: metric_name{label="value",...} value timestamp
-        # Example: temporal_cloud_v1_workflow_success_count{temporal_namespace="prod"} 42.0 1609459200000
-        pattern = re.compile(
-            r'^([a-zA-Z_][a-zA-Z0-9_]*)\{([^}]*)\}\s+([\d.]+)(?:\s+\d+)?$'
+        # defaultdicts accumulate with a single key hash per update instead
+        # of the get-default-then-store double hash
+        grouped: defaultdict[str, defaultdict[str, float]] = defaultdict(
+            lambda: defaultdict(float)
         )
-        
-        for line in text.split('\n'):
-            line = line.strip()
-            
+        intern = sys.intern
+
+        for line_match in _LINE_PATTERN.finditer(text):
+            line = line_match.group().strip()
+
             # Skip comments and TYPE/HELP lines
             if line.startswith('#') or not line:
                 continue
-            
-            match = pattern.match(line)
+
+            # Cheap substring rejection before any regex work: every sample
+            # we keep must carry a temporal_namespace label
+            if 'temporal_namespace=' not in line:
+                continue
+
+            match = _SAMPLE_PATTERN.match(line)
             if match:
                 metric_name = match.group(1)
                 labels_str = match.group(2)
                 value = float(match.group(3))
-                
-                # Parse labels
-                labels = {}
-                label_pattern = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="([^"]*)"')
-                for label_match in label_pattern.finditer(labels_str):
-                    labels[label_match.group(1)] = label_match.group(2)
-                
-                # Only include metrics for our namespace
-                if labels.get('temporal_namespace') == namespace:
-                    # Create a key that includes relevant label info
-                    key = metric_name
-                    if 'temporal_workflow_type' in labels:
-                        key = f"{metric_name}:{labels['temporal_workflow_type']}"
-                    
+
+                # Slice straight to the temporal_namespace value with
+                # partition instead of tokenizing every label; the leading
+                # ',' anchors the match at a label boundary so longer label
+                # names such as other_temporal_namespace never match
+                namespace = (
+                    (',' + labels_str)
+                    .partition(',temporal_namespace="')[2]
+                    .partition('"')[0]
+                )
+                if namespace:
                     # Aggregate metrics (sum across all workflow types, task queues, etc.)
-                    metrics[metric_name] = metrics.get(metric_name, 0.0) + value
-        
-        return metrics
+                    grouped[intern(namespace)][intern(metric_name)] += value
+
+        return grouped
+
+    def _parse_openmetrics(self, text: str, namespace: str) -> dict[str, float]:
+        """Parse OpenMetrics format text into a dictionary of metric values.
+
+        Args:
+            text: OpenMetrics format text response
+            namespace: The namespace to filter for
+
+        Returns:
+            Dictionary mapping metric names to their values
+        """
+        # Memoize the grouped parse of the most recent payload so N
+        # per-namespace calls against the same scrape parse it once. The
+        # cached text itself is the key: the identity check catches the
+        # common repeated-argument case, and the equality fallback is exact
+        # where a bare hash comparison could collide.
+        cached_text = self._grouped_parse_text
+        if (
+            self._grouped_parse_cache is None
+            or cached_text is None
+            or not (text is cached_text or text == cached_text)
+        ):
+            self._grouped_parse_cache = self._parse_openmetrics_grouped(text)
+            self._grouped_parse_text = text
+
+        # Copy so callers can never mutate the memoized parse, and hits and
+        # misses alike return a plain dict
+        metrics = self._grouped_parse_cache.get(namespace)
+        return dict(metrics) if metrics else {}
+
+    @staticmethod
+    def _workflow_rates(metrics: dict[str, float]) -> tuple[float, float, float]:
+        """Extract the per-second workflow success/failed/started rates.
+
+        Shared by the actions-per-hour and throttling calculations so the
+        metric-key lookups are written (and maintained) once.
+
+        Args:
+            metrics: Parsed metrics dictionary
+
+        Returns:
+            Tuple of (success_per_sec, failed_per_sec, started_per_sec)
+        """
+        get = metrics.get
+        return (
+            get('temporal_cloud_v1_workflow_success_count', 0.0),
+            get('temporal_cloud_v1_workflow_failed_count', 0.0),
+            get('temporal_cloud_v1_workflow_start_count', 0.0),
+        )
 
     def _calculate_actions_per_hour(self, metrics: dict[str, float]) -> int:
         """Calculate actions per hour from workflow completion metrics.
@@ -283,12 +414,7 @@ class OpenMetricsClient:
             Estimated actions per hour
         """
         # Workflow completion metrics are per-second rates
-        # Sum successful and failed workflows to get total actions per second
-        success_per_sec = metrics.get('temporal_cloud_v1_workflow_success_count', 0.0)
-        failed_per_sec = metrics.get('temporal_cloud_v1_workflow_failed_count', 0.0)
-        
-        # Also consider workflow starts as actions
-        started_per_sec = metrics.get('temporal_cloud_v1_workflow_start_count', 0.0)
+        success_per_sec, failed_per_sec, started_per_sec = self._workflow_rates(metrics)
         
         # Use the max of completions or starts as the primary indicator
         actions_per_sec = max(success_per_sec + failed_per_sec, started_per_sec)
@@ -297,9 +423,8 @@ class OpenMetricsClient:
         actions_per_hour = int(actions_per_sec * 3600)
         
         logger.debug(
-            f"Calculated actions/hour: {actions_per_hour} "
-            f"(success: {success_per_sec}/s, failed: {failed_per_sec}/s, "
-            f"started: {started_per_sec}/s)"
+            "Calculated actions/hour: %d (success: %s/s, failed: %s/s, started: %s/s)",
+            actions_per_hour, success_per_sec, failed_per_sec, started_per_sec,
         )
         
         return actions_per_hour
@@ -319,13 +444,10 @@ class OpenMetricsClient:
         resource_exhausted = metrics.get(
             'temporal_cloud_v1_resource_exhausted_count', 0.0
         )
-        
+
         # Get total request rate to calculate percentage
-        total_requests = (
-            metrics.get('temporal_cloud_v1_workflow_success_count', 0.0)
-            + metrics.get('temporal_cloud_v1_workflow_failed_count', 0.0)
-            + metrics.get('temporal_cloud_v1_workflow_start_count', 0.0)
-        )
+        success_per_sec, failed_per_sec, started_per_sec = self._workflow_rates(metrics)
+        total_requests = success_per_sec + failed_per_sec + started_per_sec
         
         # If we're seeing resource exhausted errors, we're being throttled
         is_throttled = resource_exhausted > 0
@@ -336,9 +458,8 @@ class OpenMetricsClient:
             throttle_percentage = (resource_exhausted / total_requests) * 100
         
         logger.debug(
-            f"Throttling check: is_throttled={is_throttled}, "
-            f"percentage={throttle_percentage:.2f}%, "
-            f"resource_exhausted={resource_exhausted}/s"
+            "Throttling check: is_throttled=%s, percentage=%.2f%%, resource_exhausted=%s/s",
+            is_throttled, throttle_percentage, resource_exhausted,
         )
         
         return is_throttled, throttle_percentage
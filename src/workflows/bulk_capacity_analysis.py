@@ -26,6 +26,11 @@ class BulkCapacityAnalysisWorkflow:
     This workflow doesn't take any action on the namespaces, it just provides info and recommendations.
     """
 
+    def __init__(self) -> None:
+        # Status string maintained as the workflow progresses so the query
+        # handler returns a precomputed value instead of scanning results
+        self._status = "pending"
+
     @workflow.run
     async def run(self) -> list[NamespaceRecommendation]:
         """Execute the bulk capacity analysis workflow.
@@ -34,6 +39,7 @@ class BulkCapacityAnalysisWorkflow:
             List of NamespaceRecommendation objects with metrics and recommendations
         """
         workflow.logger.info("Starting bulk capacity analysis workflow")
+        self._status = "analyzing"
 
         try:
             # Make single API call to get all namespace metrics and recommendations
@@ -49,10 +55,11 @@ class BulkCapacityAnalysisWorkflow:
                 ),
             )
 
+            self._status = f"completed: {len(recommendations)} recommendations"
             workflow.logger.info(
                 f"Workflow completed: analyzed {len(recommendations)} namespaces"
             )
-            
+
             # Log summary
             for rec in recommendations:
                 workflow.logger.info(str(rec))
@@ -61,6 +68,7 @@ class BulkCapacityAnalysisWorkflow:
 
         except Exception as e:
             error_msg = f"Fatal error in workflow: {str(e)}"
+            self._status = f"failed: {str(e)}"
             workflow.logger.error(error_msg)
             raise
 
@@ -71,4 +79,4 @@ class BulkCapacityAnalysisWorkflow:
         Returns:
             Status string
         """
-        return "Bulk capacity analysis workflow"
+        return self._status
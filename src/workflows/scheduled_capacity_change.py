@@ -21,6 +21,20 @@ with workflow.unsafe.imports_passed_through():
 
 logger = logging.getLogger(__name__)
 
+# Shared activity options, built once at import instead of per activity call
+_DEFAULT_RETRY_POLICY = RetryPolicy(
+    initial_interval=timedelta(seconds=1),
+    maximum_interval=timedelta(seconds=30),
+    maximum_attempts=3,
+    backoff_coefficient=2.0,
+)
+_PROVISIONING_TIMEOUT = timedelta(minutes=5)
+_VERIFICATION_TIMEOUT = timedelta(minutes=2)
+_NOTIFICATION_TIMEOUT = timedelta(seconds=30)
+# Default wait between applying a capacity change and verifying it; the
+# input can override it (see ScheduledCapacityChangeInput)
+_VERIFICATION_DELAY = timedelta(minutes=2)
+
 
 @workflow.defn
 class ScheduledCapacityChangeWorkflow:
@@ -28,7 +42,7 @@ class ScheduledCapacityChangeWorkflow:
 
     This workflow:
     1. Immediately sets a namespace to a specific number of TRUs
-    2. After 2 minutes, verifies the change was successful
+    2. After a short delay (2 minutes by default), verifies the change was successful
     3. Sends Slack alert if verification fails
     4. If an end time was provided, sleeps until that time and reverts to on-demand
     5. Verifies the revert was successful and alerts if not
@@ -44,7 +58,40 @@ class ScheduledCapacityChangeWorkflow:
         Returns:
             ScheduledCapacityChangeResult with status of all operations
         """
-        workflow.logger.info(
+        # Local aliases avoid repeated module-attribute lookups across the
+        # many activity calls and log statements in this method
+        execute_activity = workflow.execute_activity
+        log = workflow.logger
+
+        verification_delay = (
+            timedelta(seconds=input.verification_delay_seconds)
+            if input.verification_delay_seconds is not None
+            else _VERIFICATION_DELAY
+        )
+
+        async def notify(message: str, severity: NotificationSeverity) -> None:
+            """Send a best-effort Slack notification; failures are logged only."""
+            try:
+                await execute_activity(
+                    send_slack_notification,
+                    args=[message, severity],
+                    start_to_close_timeout=_NOTIFICATION_TIMEOUT,
+                    task_queue=input.activity_task_queue,
+                )
+            except Exception as notify_error:
+                log.error(f"Failed to send notification: {notify_error}")
+
+        async def verify(expected_mode: str, expected_trus: int) -> bool:
+            """Run the capacity verification activity with shared options."""
+            return await execute_activity(
+                verify_namespace_capacity,
+                args=[input.namespace, expected_mode, expected_trus],
+                start_to_close_timeout=_VERIFICATION_TIMEOUT,
+                task_queue=input.activity_task_queue,
+                retry_policy=_DEFAULT_RETRY_POLICY,
+            )
+
+        log.info(
             f"Starting scheduled capacity change workflow for {input.namespace}: "
             f"Set to {input.desired_trus} TRUs"
             + (f", revert at {input.end_time}" if input.end_time else "")
@@ -57,40 +104,32 @@ class ScheduledCapacityChangeWorkflow:
         revert_verification_success = False
 
         # Step 1: Enable provisioning immediately
-        workflow.logger.info(
+        log.info(
             f"Step 1: Enabling provisioning for {input.namespace} "
             f"with {input.desired_trus} TRUs"
         )
         try:
-            await workflow.execute_activity(
+            await execute_activity(
                 enable_provisioning,
                 args=[input.namespace, input.desired_trus],
-                start_to_close_timeout=timedelta(minutes=5),
-                retry_policy=RetryPolicy(
-                    initial_interval=timedelta(seconds=1),
-                    maximum_interval=timedelta(seconds=30),
-                    maximum_attempts=3,
-                    backoff_coefficient=2.0,
-                ),
+                start_to_close_timeout=_PROVISIONING_TIMEOUT,
+                task_queue=input.activity_task_queue,
+                retry_policy=_DEFAULT_RETRY_POLICY,
             )
             initial_change_success = True
-            workflow.logger.info(
+            log.info(
                 f"Successfully enabled provisioning for {input.namespace}"
             )
         except Exception as e:
             error_msg = f"Failed to enable provisioning for {input.namespace}: {str(e)}"
-            workflow.logger.error(error_msg)
+            log.error(error_msg)
             errors.append(error_msg)
             
             # Send critical notification
-            try:
-                await workflow.execute_activity(
-                    send_slack_notification,
-                    args=[f"❌ Scheduled capacity change failed for {input.namespace}: {error_msg}", NotificationSeverity.CRITICAL],
-                    start_to_close_timeout=timedelta(seconds=30),
-                )
-            except Exception as notify_error:
-                workflow.logger.error(f"Failed to send notification: {notify_error}")
+            await notify(
+                f"❌ Scheduled capacity change failed for {input.namespace}: {error_msg}",
+                NotificationSeverity.CRITICAL,
+            )
             
             # Return early if initial change failed
             return ScheduledCapacityChangeResult(
@@ -100,30 +139,20 @@ class ScheduledCapacityChangeWorkflow:
                 errors=errors,
             )
 
-        # Step 2: Wait 2 minutes before verification
-        workflow.logger.info("Step 2: Waiting 2 minutes before verification")
-        await workflow.sleep(timedelta(minutes=2))
+        # Step 2: Wait before verification
+        log.info(f"Step 2: Waiting {verification_delay} before verification")
+        await workflow.sleep(verification_delay)
 
         # Step 3: Verify the change
-        workflow.logger.info(
+        log.info(
             f"Step 3: Verifying capacity for {input.namespace} "
             f"(expected provisioned mode with {input.desired_trus} TRUs)"
         )
         try:
-            verification_success = await workflow.execute_activity(
-                verify_namespace_capacity,
-                args=[input.namespace, "provisioned", input.desired_trus],
-                start_to_close_timeout=timedelta(minutes=2),
-                retry_policy=RetryPolicy(
-                    initial_interval=timedelta(seconds=1),
-                    maximum_interval=timedelta(seconds=30),
-                    maximum_attempts=3,
-                    backoff_coefficient=2.0,
-                ),
-            )
+            verification_success = await verify("provisioned", input.desired_trus)
             
             if verification_success:
-                workflow.logger.info(
+                log.info(
                     f"✓ Verification successful: {input.namespace} has "
                     f"{input.desired_trus} TRUs provisioned"
                 )
@@ -132,91 +161,71 @@ class ScheduledCapacityChangeWorkflow:
                     f"Verification failed: {input.namespace} does not have "
                     f"the expected capacity ({input.desired_trus} TRUs)"
                 )
-                workflow.logger.error(error_msg)
+                log.error(error_msg)
                 errors.append(error_msg)
                 
                 # Send error notification
-                try:
-                    await workflow.execute_activity(
-                        send_slack_notification,
-                        args=[
-                            f"⚠️ Capacity verification failed for {input.namespace}: "
-                            f"Expected {input.desired_trus} TRUs but verification did not pass. "
-                            f"Please check the namespace manually.",
-                            NotificationSeverity.ERROR
-                        ],
-                        start_to_close_timeout=timedelta(seconds=30),
-                    )
-                except Exception as notify_error:
-                    workflow.logger.error(f"Failed to send notification: {notify_error}")
+                await notify(
+                    f"⚠️ Capacity verification failed for {input.namespace}: "
+                    f"Expected {input.desired_trus} TRUs but verification did not pass. "
+                    f"Please check the namespace manually.",
+                    NotificationSeverity.ERROR,
+                )
         except Exception as e:
             error_msg = f"Failed to verify capacity for {input.namespace}: {str(e)}"
-            workflow.logger.error(error_msg)
+            log.error(error_msg)
             errors.append(error_msg)
             
             # Send error notification
-            try:
-                await workflow.execute_activity(
-                    send_slack_notification,
-                    args=[f"⚠️ Capacity verification error for {input.namespace}: {error_msg}", NotificationSeverity.ERROR],
-                    start_to_close_timeout=timedelta(seconds=30),
-                )
-            except Exception as notify_error:
-                workflow.logger.error(f"Failed to send notification: {notify_error}")
+            await notify(
+                f"⚠️ Capacity verification error for {input.namespace}: {error_msg}",
+                NotificationSeverity.ERROR,
+            )
 
         # Step 4: If end_time provided and verification succeeded, sleep and revert
         if input.end_time and verification_success:
-            workflow.logger.info(
+            log.info(
                 f"Step 4: End time provided ({input.end_time}), "
                 f"calculating sleep duration"
             )
             
-            # Calculate sleep duration
-            current_time = workflow.now()
-            if input.end_time > current_time:
-                sleep_duration = input.end_time - current_time
-                workflow.logger.info(
+            # Compute the remaining time to the absolute deadline once; a
+            # non-positive duration means the end time already passed
+            sleep_duration = input.end_time - workflow.now()
+            if sleep_duration > timedelta(0):
+                log.info(
                     f"Sleeping for {sleep_duration} until end time ({input.end_time})"
                 )
                 await workflow.sleep(sleep_duration)
             else:
-                workflow.logger.warning(
-                    f"End time {input.end_time} is in the past "
-                    f"(current time: {current_time}). Reverting immediately."
+                log.warning(
+                    f"End time {input.end_time} is in the past. Reverting immediately."
                 )
             
             # Revert to on-demand
-            workflow.logger.info(f"Step 5: Reverting {input.namespace} to on-demand")
+            log.info(f"Step 5: Reverting {input.namespace} to on-demand")
             try:
-                await workflow.execute_activity(
+                await execute_activity(
                     disable_provisioning,
                     args=[input.namespace],
-                    start_to_close_timeout=timedelta(minutes=5),
-                    retry_policy=RetryPolicy(
-                        initial_interval=timedelta(seconds=1),
-                        maximum_interval=timedelta(seconds=30),
-                        maximum_attempts=3,
-                        backoff_coefficient=2.0,
-                    ),
+                    start_to_close_timeout=_PROVISIONING_TIMEOUT,
+                    task_queue=input.activity_task_queue,
+                    retry_policy=_DEFAULT_RETRY_POLICY,
                 )
                 reverted_to_on_demand = True
-                workflow.logger.info(
+                log.info(
                     f"Successfully reverted {input.namespace} to on-demand"
                 )
             except Exception as e:
                 error_msg = f"Failed to revert {input.namespace} to on-demand: {str(e)}"
-                workflow.logger.error(error_msg)
+                log.error(error_msg)
                 errors.append(error_msg)
                 
                 # Send critical notification
-                try:
-                    await workflow.execute_activity(
-                        send_slack_notification,
-                        args=[f"❌ Failed to revert {input.namespace} to on-demand: {error_msg}", NotificationSeverity.CRITICAL],
-                        start_to_close_timeout=timedelta(seconds=30),
-                    )
-                except Exception as notify_error:
-                    workflow.logger.error(f"Failed to send notification: {notify_error}")
+                await notify(
+                    f"❌ Failed to revert {input.namespace} to on-demand: {error_msg}",
+                    NotificationSeverity.CRITICAL,
+                )
                 
                 # Return result with revert failure
                 return ScheduledCapacityChangeResult(
@@ -228,75 +237,51 @@ class ScheduledCapacityChangeWorkflow:
                     errors=errors,
                 )
             
-            # Wait 2 minutes before verifying revert
-            workflow.logger.info("Step 6: Waiting 2 minutes before verifying revert")
-            await workflow.sleep(timedelta(minutes=2))
+            # Wait before verifying revert
+            log.info(f"Step 6: Waiting {verification_delay} before verifying revert")
+            await workflow.sleep(verification_delay)
             
             # Verify the revert to on-demand
-            workflow.logger.info(
+            log.info(
                 f"Step 7: Verifying {input.namespace} is back to on-demand"
             )
             try:
-                revert_verification_success = await workflow.execute_activity(
-                    verify_namespace_capacity,
-                    args=[input.namespace, "on-demand", 0],  # TRUs not checked for on-demand mode
-                    start_to_close_timeout=timedelta(minutes=2),
-                    retry_policy=RetryPolicy(
-                        initial_interval=timedelta(seconds=1),
-                        maximum_interval=timedelta(seconds=30),
-                        maximum_attempts=3,
-                        backoff_coefficient=2.0,
-                    ),
-                )
+                # TRU count is not checked for on-demand mode
+                revert_verification_success = await verify("on-demand", 0)
                 
                 if revert_verification_success:
-                    workflow.logger.info(
+                    log.info(
                         f"✓ Revert verification successful: {input.namespace} is on-demand"
                     )
                     
                     # Send success notification
-                    try:
-                        await workflow.execute_activity(
-                            send_slack_notification,
-                            args=[f"✅ Successfully reverted {input.namespace} to on-demand mode", NotificationSeverity.INFO],
-                            start_to_close_timeout=timedelta(seconds=30),
-                        )
-                    except Exception as notify_error:
-                        workflow.logger.error(f"Failed to send notification: {notify_error}")
+                    await notify(
+                        f"✅ Successfully reverted {input.namespace} to on-demand mode",
+                        NotificationSeverity.INFO,
+                    )
                 else:
                     error_msg = f"Revert verification failed: {input.namespace} is not in on-demand mode"
-                    workflow.logger.error(error_msg)
+                    log.error(error_msg)
                     errors.append(error_msg)
                     
                     # Send error notification
-                    try:
-                        await workflow.execute_activity(
-                            send_slack_notification,
-                            args=[
-                                f"⚠️ Revert verification failed for {input.namespace}: "
-                                f"Expected on-demand mode but verification did not pass. "
-                                f"Please check the namespace manually.",
-                                NotificationSeverity.ERROR
-                            ],
-                            start_to_close_timeout=timedelta(seconds=30),
-                        )
-                    except Exception as notify_error:
-                        workflow.logger.error(f"Failed to send notification: {notify_error}")
+                    await notify(
+                        f"⚠️ Revert verification failed for {input.namespace}: "
+                        f"Expected on-demand mode but verification did not pass. "
+                        f"Please check the namespace manually.",
+                        NotificationSeverity.ERROR,
+                    )
                     
             except Exception as e:
                 error_msg = f"Failed to verify revert for {input.namespace}: {str(e)}"
-                workflow.logger.error(error_msg)
+                log.error(error_msg)
                 errors.append(error_msg)
                 
                 # Send error notification
-                try:
-                    await workflow.execute_activity(
-                        send_slack_notification,
-                        args=[f"⚠️ Revert verification error for {input.namespace}: {error_msg}", NotificationSeverity.ERROR],
-                        start_to_close_timeout=timedelta(seconds=30),
-                    )
-                except Exception as notify_error:
-                    workflow.logger.error(f"Failed to send notification: {notify_error}")
+                await notify(
+                    f"⚠️ Revert verification error for {input.namespace}: {error_msg}",
+                    NotificationSeverity.ERROR,
+                )
 
         # Build and return result
         result = ScheduledCapacityChangeResult(
@@ -308,5 +293,5 @@ class ScheduledCapacityChangeWorkflow:
             errors=errors,
         )
 
-        workflow.logger.info(f"Workflow completed: {result}")
+        log.info(f"Workflow completed: {result}")
         return result
@@ -0,0 +1,133 @@
+"""Shared pytest fixtures for the test suite."""
+
+import os
+
+import pytest
+import pytest_asyncio
+from unittest.mock import MagicMock, patch
+
+from temporalio.testing import WorkflowEnvironment
+
+
+# Settings attributes shared by every activity test, applied to the mock in
+# a single configure_mock call
+_SETTINGS_ATTRS = {
+    "should_manage_namespace.return_value": True,
+    "namespace_allowlist": [],
+    "temporal_cloud_metrics_api_key": "test-metrics-key",
+    "cloud_metrics_api_base_url": "https://test-metrics.com",
+    "temporal_cloud_ops_api_key": "test-ops-key",
+    "cloud_ops_api_base_url": "https://test-ops.com",
+}
+
+
+class _MetricsClientStub:
+    """Minimal async stand-in for OpenMetricsClient.
+
+    Plain async methods dispatch far faster than AsyncMock; the tests only
+    need a fixed metrics payload and a record of close() being called.
+    """
+
+    def __init__(self):
+        self.metrics_by_namespace = {}
+        self.closed = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def get_all_namespace_metrics(self, namespaces=None):
+        return self.metrics_by_namespace
+
+    async def close(self):
+        self.closed += 1
+
+
+class _CloudOpsClientStub:
+    """Minimal async stand-in for CloudOpsClient."""
+
+    def __init__(self):
+        self.namespace_infos = []
+        self.list_namespaces_error = None
+        self.closed = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def list_namespaces(self):
+        if self.list_namespaces_error is not None:
+            raise self.list_namespaces_error
+        return self.namespace_infos
+
+    async def close(self):
+        self.closed += 1
+
+
+# Run the test event loops on uvloop when it is installed. uvloop trims
+# per-callback overhead on the gRPC-heavy workflow tests and ships in the
+# optional "speed" extra. pytest-asyncio deprecated overriding the
+# event_loop_policy fixture; the supported route is the loop-factories
+# hook, registered only when uvloop is importable so the stdlib loop is
+# used untouched otherwise.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+if uvloop is not None:
+
+    def pytest_asyncio_loop_factories(config, item):
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture
+def mock_capacity_clients():
+    """Patch the activity's API clients and settings once for a test.
+
+    Setting up the three patches and the settings mock per test dominated
+    the activity tests' boilerplate; this fixture does it once and yields
+    the (metrics_client, cloud_ops_client) stubs so each test only sets
+    the return values for its scenario.
+    """
+    metrics_client = _MetricsClientStub()
+    cloud_ops_client = _CloudOpsClientStub()
+
+    # Use MagicMock for settings since it has sync methods
+    mock_settings_instance = MagicMock()
+    mock_settings_instance.configure_mock(**_SETTINGS_ATTRS)
+
+    # One patch.multiple does a single setup/restore pass on the module
+    # instead of three stacked patch() context managers
+    with patch.multiple(
+        "src.activities.namespace_ops",
+        OpenMetricsClient=MagicMock(return_value=metrics_client),
+        CloudOpsClient=MagicMock(return_value=cloud_ops_client),
+        get_settings=MagicMock(return_value=mock_settings_instance),
+    ):
+        yield metrics_client, cloud_ops_client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def workflow_env():
+    """Single time-skipping workflow environment shared by all workflow tests.
+
+    Starting the time-skipping test server is by far the most expensive part
+    of a workflow test, so it is done once per session. Tests isolate
+    themselves by using a unique task queue and workflow id instead of a
+    fresh environment.
+
+    The first run downloads the Temporal test-server binary from GitHub
+    releases. CI can avoid re-downloading it on every cold runner by caching
+    a directory and pointing TEMPORAL_TEST_SERVER_CACHE_DIR at it, or by
+    pre-installing the binary and setting TEMPORAL_TEST_SERVER_PATH.
+    """
+    async with await WorkflowEnvironment.start_time_skipping(
+        test_server_existing_path=os.environ.get("TEMPORAL_TEST_SERVER_PATH"),
+        download_dest_dir=os.environ.get("TEMPORAL_TEST_SERVER_CACHE_DIR"),
+    ) as env:
+        yield env
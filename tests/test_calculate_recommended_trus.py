@@ -253,3 +253,49 @@ class TestCalculateRecommendedTrusRealWorldScenarios:
         # optimal = 1, next_trus = 1, but 0 < 500 so scale to 0
         result = _calculate_recommended_trus(action_limit=1000.0, action_count=0.0)
         assert result == 0  # Scale down to 0 (no usage)
+
+
+class TestCalculateRecommendedTrusInvariants:
+    """Grid-based invariant checks across a wide range of inputs.
+
+    A batched sweep covers the interactions the scenario tests above cannot
+    enumerate, asserting properties that must hold for any input instead of
+    specific expected values.
+    """
+
+    # Limits covering on-demand, the 1-TRU special case, and 2-10 TRUs;
+    # counts step across every branch boundary (base capacity, minimum
+    # charged thresholds, and the 80% scale-up line)
+    ACTION_LIMITS = [0.0, 250.0, 500.0, 750.0, 1000.0, 1500.0, 2500.0, 5000.0]
+    ACTION_COUNTS = [float(c) for c in range(0, 3001, 50)]
+
+    def test_never_recommends_one_tru(self):
+        """1 TRU is equivalent to 0 TRUs and must never be recommended."""
+        for limit in self.ACTION_LIMITS:
+            for count in self.ACTION_COUNTS:
+                result = _calculate_recommended_trus(limit, count)
+                assert isinstance(result, int)
+                assert result >= 0
+                assert result != 1, f"recommended 1 TRU for limit={limit}, count={count}"
+
+    def test_unprovisioned_threshold(self):
+        """From 0/1 TRUs, provisioning is recommended iff usage exceeds base capacity."""
+        for limit in (0.0, 250.0, 500.0, 750.0):  # all floor to 0 effective TRUs
+            for count in self.ACTION_COUNTS:
+                result = _calculate_recommended_trus(limit, count)
+                if count <= 500.0:
+                    assert result == 0
+                else:
+                    assert result >= 2
+
+    def test_monotonic_in_action_count(self):
+        """For a fixed limit, more usage never lowers the recommendation."""
+        for limit in self.ACTION_LIMITS:
+            previous = -1
+            for count in self.ACTION_COUNTS:
+                result = _calculate_recommended_trus(limit, count)
+                assert result >= previous, (
+                    f"recommendation dropped from {previous} to {result} "
+                    f"at limit={limit}, count={count}"
+                )
+                previous = result
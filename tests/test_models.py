@@ -0,0 +1,199 @@
+"""Tests for the capacity management data models.
+
+These tests are synchronous and Temporal-free; keeping them in their own
+module means the asyncio plugin never has to set up an event loop for
+them.
+"""
+
+import pytest
+from datetime import datetime
+
+from src.models.types import (
+    NamespaceRecommendation,
+    ScheduledCapacityChangeInput,
+    ScheduledCapacityChangeResult,
+)
+
+
+# Recommendation-model cases: (constructor kwargs, expected attribute
+# values, substrings required in str(rec))
+RECOMMENDATION_MODEL_CASES = [
+    pytest.param(
+        {
+            "namespace": "test-ns",
+            "action_limit": 500.0,
+            "action_count": 250.0,
+            "recommended_trus": 0,
+            "current_capacity_mode": "on-demand",
+            "current_trus": None,
+            "recommended_capacity_mode": "on-demand",
+        },
+        {
+            "namespace": "test-ns",
+            "current_capacity_mode": "on-demand",
+            "current_trus": None,
+            "recommended_capacity_mode": "on-demand",
+            "recommended_trus": 0,
+        },
+        ["test-ns", "on-demand", "N/A"],
+        id="on_demand_recommendation",
+    ),
+    pytest.param(
+        {
+            "namespace": "test-ns-heavy",
+            "action_limit": 2500.0,
+            "action_count": 2000.0,
+            "recommended_trus": 5,
+            "current_capacity_mode": "provisioned",
+            "current_trus": 4,
+            "recommended_capacity_mode": "provisioned",
+        },
+        {
+            "namespace": "test-ns-heavy",
+            "current_capacity_mode": "provisioned",
+            "current_trus": 4,
+            "recommended_capacity_mode": "provisioned",
+            "recommended_trus": 5,
+        },
+        ["test-ns-heavy", "provisioned", "4 TRUs", "5 TRUs"],
+        id="provisioned_recommendation",
+    ),
+    pytest.param(
+        # Scale down from provisioned to on-demand
+        {
+            "namespace": "test-ns-light",
+            "action_limit": 1500.0,
+            "action_count": 100.0,
+            "recommended_trus": 0,
+            "current_capacity_mode": "provisioned",
+            "current_trus": 3,
+            "recommended_capacity_mode": "on-demand",
+        },
+        {
+            "current_capacity_mode": "provisioned",
+            "recommended_capacity_mode": "on-demand",
+            "current_trus": 3,
+            "recommended_trus": 0,
+        },
+        [],
+        id="scale_down_recommendation",
+    ),
+]
+
+
+class TestNamespaceRecommendationModel:
+    """Tests for the NamespaceRecommendation model."""
+
+    @pytest.mark.parametrize(
+        "kwargs, expected_attrs, expected_substrings", RECOMMENDATION_MODEL_CASES
+    )
+    def test_recommendation(self, kwargs, expected_attrs, expected_substrings):
+        """Construct one recommendation and check attributes and repr."""
+        rec = NamespaceRecommendation(**kwargs)
+
+        for attr, expected in expected_attrs.items():
+            assert getattr(rec, attr) == expected
+
+        str_repr = str(rec)
+        for substring in expected_substrings:
+            assert substring in str_repr
+
+
+# Model-constructor cases: (model class, constructor kwargs, expected
+# attribute values, substrings required in str(obj))
+MODEL_CASES = [
+    pytest.param(
+        ScheduledCapacityChangeInput,
+        {"namespace": "test-namespace.account", "desired_trus": 5},
+        {"namespace": "test-namespace.account", "desired_trus": 5, "end_time": None},
+        ["test-namespace.account", "5 TRUs", "no revert scheduled"],
+        id="input_without_end_time",
+    ),
+    pytest.param(
+        ScheduledCapacityChangeInput,
+        {
+            "namespace": "test-namespace.account",
+            "desired_trus": 10,
+            "end_time": datetime(2026, 1, 16, 12, 0, 0),
+        },
+        {
+            "namespace": "test-namespace.account",
+            "desired_trus": 10,
+            "end_time": datetime(2026, 1, 16, 12, 0, 0),
+        },
+        ["test-namespace.account", "10 TRUs", "revert at"],
+        id="input_with_end_time",
+    ),
+    pytest.param(
+        ScheduledCapacityChangeResult,
+        {
+            "namespace": "test-ns.account",
+            "initial_change_success": True,
+            "verification_success": True,
+        },
+        {
+            "namespace": "test-ns.account",
+            "initial_change_success": True,
+            "verification_success": True,
+            "reverted_to_on_demand": False,
+            "revert_verification_success": False,
+            "errors": [],
+        },
+        ["SUCCESS", "test-ns.account", "verified"],
+        id="result_success_without_revert",
+    ),
+    pytest.param(
+        ScheduledCapacityChangeResult,
+        {
+            "namespace": "test-ns.account",
+            "initial_change_success": True,
+            "verification_success": True,
+            "reverted_to_on_demand": True,
+            "revert_verification_success": True,
+        },
+        {
+            "reverted_to_on_demand": True,
+            "revert_verification_success": True,
+        },
+        ["SUCCESS", "reverted to on-demand and verified"],
+        id="result_success_with_revert",
+    ),
+    pytest.param(
+        ScheduledCapacityChangeResult,
+        {
+            "namespace": "test-ns.account",
+            "initial_change_success": False,
+            "verification_success": False,
+            "errors": ["Failed to enable provisioning: API error"],
+        },
+        {
+            "initial_change_success": False,
+            "verification_success": False,
+            "errors": ["Failed to enable provisioning: API error"],
+        },
+        ["FAILED", "1 error(s)"],
+        id="result_failure",
+    ),
+]
+
+
+class TestScheduledCapacityChangeModels:
+    """Tests for the ScheduledCapacityChange model classes."""
+
+    @pytest.mark.parametrize(
+        "model_cls, kwargs, expected_attrs, expected_substrings", MODEL_CASES
+    )
+    def test_model(self, model_cls, kwargs, expected_attrs, expected_substrings):
+        """Construct one model and check its attributes and representation."""
+        obj = model_cls(**kwargs)
+
+        for attr, expected in expected_attrs.items():
+            assert getattr(obj, attr) == expected
+
+        str_repr = str(obj)
+        for substring in expected_substrings:
+            assert substring in str_repr
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-q", "-p", "no:cacheprovider"])
@@ -76,7 +76,7 @@ def test_check_throttling():
     
     is_throttled, percentage = client._check_throttling(metrics_no_throttle)
     assert is_throttled is False
-    assert percentage == 0.0
+    assert percentage == pytest.approx(0.0)
 
 
 def test_parse_openmetrics_no_namespace_match():
@@ -88,7 +88,26 @@ temporal_cloud_v1_workflow_success_count{temporal_namespace="production"} 2.0 16
 """
     
     metrics = client._parse_openmetrics(openmetrics_text, "production")
-    assert metrics["temporal_cloud_v1_workflow_success_count"] == 2.0
-    
+    assert metrics["temporal_cloud_v1_workflow_success_count"] == pytest.approx(2.0)
+
     metrics_other = client._parse_openmetrics(openmetrics_text, "other-namespace")
-    assert metrics_other["temporal_cloud_v1_workflow_success_count"] == 1.0
+    assert metrics_other["temporal_cloud_v1_workflow_success_count"] == pytest.approx(1.0)
+
+
+def test_parse_ignores_lookalike_namespace_labels():
+    """Labels merely ending in temporal_namespace must not be attributed."""
+    client = OpenMetricsClient(api_key="test-key")
+
+    openmetrics_text = """temporal_cloud_v1_workflow_success_count{other_temporal_namespace="ghost"} 1.0 1609459200000
+temporal_cloud_v1_workflow_success_count{temporal_namespace="production"} 2.0 1609459200000
+temporal_cloud_v1_action_limit{other_temporal_namespace="ghost"} 500.0 1609459200000
+temporal_cloud_v1_action_limit{temporal_namespace="production",region="aws-us-west-2"} 500.0 1609459200000
+"""
+
+    assert client._parse_openmetrics(openmetrics_text, "ghost") == {}
+    metrics = client._parse_openmetrics(openmetrics_text, "production")
+    assert metrics["temporal_cloud_v1_workflow_success_count"] == pytest.approx(2.0)
+
+    all_metrics = client._parse_all_namespace_metrics(openmetrics_text)
+    assert "ghost" not in all_metrics
+    assert all_metrics["production"]["action_limit"] == pytest.approx(500.0)